@@ -449,6 +449,7 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         self._name: str = name
         self._divisions: tuple[int | None, ...] = divisions
         self._meta: ak.Array = meta
+        self._delayed_graphs: dict[Callable, HighLevelGraph] = {}
 
     def __dask_graph__(self) -> HighLevelGraph:
         return self.dask
@@ -607,6 +608,24 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         """NumPy array of task graph keys."""
         return np.array(self.__dask_keys__(), dtype=object)
 
+    def _delayed_graph(self) -> HighLevelGraph:
+        """Optimized task graph used by optimized ``to_delayed`` calls.
+
+        Cached per optimizer, which can be swapped through the dask
+        config.
+
+        """
+        optimize = type(self).__dask_optimize__
+        graph = self._delayed_graphs.get(optimize)
+        if graph is None:
+            graph = HighLevelGraph.from_collections(
+                f"delayed-{self.name}",
+                optimize(self.__dask_graph__(), self.__dask_keys__()),
+                dependencies=(),
+            )
+            self._delayed_graphs[optimize] = graph
+        return graph
+
     def _partitions(self, index: Any) -> Array:
         if not isinstance(index, tuple):
             index = (index,)
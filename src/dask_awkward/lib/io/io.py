@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 import awkward._v2 as ak
 import numpy as np
 from awkward._v2.types.numpytype import primitive_to_dtype
-from dask.base import flatten, tokenize
+from dask.base import tokenize
 from dask.highlevelgraph import HighLevelGraph
 from dask.utils import funcname
 
@@ -63,6 +63,20 @@ def from_awkward(source: ak.Array, npartitions: int, label: str | None = None) -
 
     """
     nrows = len(source)
+    token = tokenize(source, npartitions)
+    if npartitions == 1:
+        # a single partition is the source itself; skip the IO layer
+        name = f"{label or 'from-awkward'}-{token}"
+        hlg = HighLevelGraph.from_collections(
+            name, {(name, 0): source}, dependencies=()
+        )
+        return new_array_object(
+            hlg,
+            name,
+            meta=typetracer_array(source),
+            divisions=(0, nrows),
+        )
+
     chunksize = int(math.ceil(nrows / npartitions))
     locs = list(range(0, nrows, chunksize)) + [nrows]
     starts = locs[:-1]
@@ -73,7 +87,7 @@ def from_awkward(source: ak.Array, npartitions: int, label: str | None = None) -
         starts,
         stops,
         label=label or "from-awkward",
-        token=tokenize(source, npartitions),
+        token=token,
         divisions=tuple(locs),
         meta=meta,
     )
@@ -84,6 +98,10 @@ class _FromListsFn:
         pass
 
     def __call__(self, x):
+        # the first partition is materialized on the client while
+        # determining the metadata; reuse it rather than rebuilding.
+        if isinstance(x, ak.Array):
+            return x
         return ak.Array(x)
 
 
@@ -114,13 +132,16 @@ def from_lists(source: list[list[Any]]) -> Array:
 
     """
     lists = list(source)
-    divs = (0, *np.cumsum(list(map(len, lists))))
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    divs = (0, *np.cumsum(lengths).tolist())
+    head = ak.Array(lists[0])
     return from_map(
         _FromListsFn(),
-        lists,
-        meta=typetracer_array(ak.Array(lists[0])),
+        [head, *lists[1:]],
+        meta=typetracer_array(head),
         divisions=divs,
         label="from-lists",
+        token=tokenize(lists),
     )
 
 
@@ -153,11 +174,36 @@ def from_delayed(
         Resulting Array collection.
 
     """
+    from dask.blockwise import Blockwise, BlockwiseDepDict, blockwise_token
     from dask.delayed import Delayed
+    from tlz import identity
 
     parts = [source] if isinstance(source, Delayed) else source
     name = f"{prefix}-{tokenize(parts)}"
-    dsk = {(name, i): part.key for i, part in enumerate(parts)}
+    dsk: Mapping
+    if any(_from_blockwise_layer(part) for part in parts):
+        # the blockwise optimization would try to fuse a key-based
+        # blockwise layer into its upstream blockwise layer, so keep
+        # these tasks materialized.
+        dsk = {(name, i): part.key for i, part in enumerate(parts)}
+    else:
+        # a blockwise layer (rather than a raw dict) can be fused with
+        # the layers that follow it by the blockwise optimizations.
+        dsk = Blockwise(
+            output=name,
+            output_indices="i",
+            dsk={name: (identity, blockwise_token(0))},
+            indices=[
+                (
+                    BlockwiseDepDict(
+                        {(i,): part.key for i, part in enumerate(parts)},
+                        produces_keys=True,
+                    ),
+                    "i",
+                )
+            ],
+            numblocks={},
+        )
     if divisions is None:
         divs: tuple[int | None, ...] = (None,) * (len(parts) + 1)
     else:
@@ -168,6 +214,18 @@ def from_delayed(
     return new_array_object(hlg, name=name, meta=meta, divisions=divs)
 
 
+def _from_blockwise_layer(part: Delayed) -> bool:
+    from dask.blockwise import Blockwise
+
+    graph = part.__dask_graph__()
+    if not isinstance(graph, HighLevelGraph):
+        return False
+    return any(
+        isinstance(graph.layers.get(layer), Blockwise)
+        for layer in part.__dask_layers__()
+    )
+
+
 def to_delayed(array: Array, optimize_graph: bool = True) -> list[Delayed]:
     """Convert the collection to a list of delayed objects.
 
@@ -191,9 +249,10 @@ def to_delayed(array: Array, optimize_graph: bool = True) -> list[Delayed]:
     graph = array.__dask_graph__()
     layer = array.__dask_layers__()[0]
     if optimize_graph:
-        graph = array.__dask_optimize__(graph, keys)
+        # the optimized graph is cached on the collection so repeated
+        # conversions do not rerun the optimizations
+        graph = array._delayed_graph()
         layer = f"delayed-{array.name}"
-        graph = HighLevelGraph.from_collections(layer, graph, dependencies=())
     return [Delayed(k, graph, layer=layer) for k in keys]
 
 
@@ -243,22 +302,22 @@ def to_dask_array(array: Array) -> DaskArray:
     else:
         # assert ndim > 1
         content = array._meta.layout.form.type.content
-        no_primitive = not hasattr(content, "primitive")
-        while no_primitive:
+        primitive = getattr(content, "primitive", None)
+        while primitive is None:
             content = content.content
-            no_primitive = not hasattr(content, "primitive")
-        dtype = primitive_to_dtype(content.primitive)
+            primitive = getattr(content, "primitive", None)
+        dtype = primitive_to_dtype(primitive)
 
         name = f"to-dask-array-{tokenize(array)}"
         nan_tuples_innerdims = ((np.nan,),) * (ndim - 1)
         chunks = ((np.nan,) * array.npartitions, *nan_tuples_innerdims)
         zeros = (0,) * (ndim - 1)
 
+        # awkward collection keys are already flat
+        keys = array.__dask_keys__()
+
         # eventually convert to HLG (if possible)
-        llg = {
-            (name, i, *zeros): (ak.to_numpy, k)
-            for i, k in enumerate(flatten(array.__dask_keys__()))
-        }
+        llg = {(name, i, *zeros): (ak.to_numpy, k) for i, k in enumerate(keys)}
 
         graph = HighLevelGraph.from_collections(name, llg, dependencies=[array])
         return new_da_object(graph, name, meta=None, chunks=chunks, dtype=dtype)
@@ -307,14 +366,18 @@ def from_dask_array(array: DaskArray) -> Array:
     if np.any(np.isnan(array.chunks)):
         return new_array_object(hlg, name, npartitions=array.npartitions, meta=meta)
     else:
-        divs = (0, *np.cumsum(array.chunks))
+        chunks = np.asarray(array.chunks[0], dtype=np.int64)
+        divs = (0, *np.cumsum(chunks).tolist())
         return new_array_object(hlg, name, divisions=divs, meta=meta)
 
 
 class PackedArgCallable:
     """Wrap a callable such that packed arguments can be unrolled.
 
-    Inspired by dask.dataframe.io.io._PackedArgCallable.
+    Inspired by dask.dataframe.io.io._PackedArgCallable. Use
+    :func:`_packed_arg_callable` to pick the subclass specialized for
+    the packing and extra arguments when the graph is built, so that
+    each call avoids branching and defaulting.
 
     """
 
@@ -326,18 +389,46 @@ class PackedArgCallable:
         packed: bool = False,
     ):
         self.func = func
-        self.args = args
-        self.kwargs = kwargs
+        self.args = tuple(args or ())
+        self.kwargs = dict(kwargs or {})
         self.packed = packed
 
     def __call__(self, packed_arg):
         if not self.packed:
             packed_arg = (packed_arg,)
-        return self.func(
-            *packed_arg,
-            *(self.args or []),
-            **(self.kwargs or {}),
-        )
+        return self.func(*packed_arg, *self.args, **self.kwargs)
+
+
+class _PackedCall(PackedArgCallable):
+    def __call__(self, packed_arg):
+        return self.func(*packed_arg)
+
+
+class _PackedCallWithExtras(PackedArgCallable):
+    def __call__(self, packed_arg):
+        return self.func(*packed_arg, *self.args, **self.kwargs)
+
+
+class _UnpackedCallWithExtras(PackedArgCallable):
+    def __call__(self, arg):
+        return self.func(arg, *self.args, **self.kwargs)
+
+
+def _packed_arg_callable(
+    func: Callable,
+    args: tuple[Any, ...] | None = None,
+    kwargs: dict[str, Any] | None = None,
+    packed: bool = False,
+) -> PackedArgCallable:
+    """Wrap `func` with the PackedArgCallable specialized for its inputs."""
+    cls: type[PackedArgCallable]
+    if not packed:
+        cls = _UnpackedCallWithExtras
+    elif args or kwargs:
+        cls = _PackedCallWithExtras
+    else:
+        cls = _PackedCall
+    return cls(func, args=args, kwargs=kwargs, packed=packed)
 
 
 def from_map(
@@ -430,7 +521,7 @@ def from_map(
 
     # Define io_func
     if packed or args or kwargs:
-        func = PackedArgCallable(
+        func = _packed_arg_callable(
             func,
             args=args,
             kwargs=kwargs,
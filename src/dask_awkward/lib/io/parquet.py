@@ -1,20 +1,26 @@
 import abc
+import functools
 import itertools
 import math
-import operator
+from concurrent.futures import ThreadPoolExecutor
 
-import fsspec
-import pyarrow.parquet as pq
+import numpy as np
+from awkward._v2 import forms as ak_forms
 from awkward._v2.operations import ak_from_parquet, from_buffers, to_arrow_table
 from awkward._v2.operations.ak_from_parquet import _load
 from dask.base import tokenize
 from dask.blockwise import BlockIndex
 from dask.highlevelgraph import HighLevelGraph
-from fsspec.core import get_fs_token_paths
+from tlz import partition_all
 
 from dask_awkward.lib.core import map_partitions, new_scalar_object, typetracer_array
 from dask_awkward.lib.io.io import from_map
 
+# read options passed to awkward's parquet loader
+_FOOTER_SAMPLE_SIZE = 2**15
+_MAX_GAP = 2**10
+_MAX_BLOCK = 2**22
+
 
 class _FromParquetFn:
     def __init__(self, columns=None, schema=None):
@@ -41,12 +47,14 @@ class _FromParquetFileWiseFn(_FromParquetFn):
 
 
 class _FromParquetFragmentWiseFn(_FromParquetFn):
-    def __init__(self, fs, columns, schema):
+    def __init__(self, fs, columns, schema, paths):
         super().__init__(columns=columns, schema=schema)
         self.fs = fs
+        self.paths = paths
 
     def __call__(self, pair):
-        subrg, source = pair
+        subrg, path_idx = pair
+        source = self.paths[path_idx]
         if isinstance(subrg, int):
             subrg = [[subrg]]
         return _file_to_partition(
@@ -54,6 +62,23 @@ class _FromParquetFragmentWiseFn(_FromParquetFn):
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _typetracer_for_subform(subform_json):
+    """Build (and cache) the typetracer metadata for a form.
+
+    Keyed by the JSON representation of the form; the resulting
+    typetracer holds no data so it is safe to share between
+    collections.
+    """
+    meta = from_buffers(
+        ak_forms.from_json(subform_json),
+        length=0,
+        container={"": b"\x00\x00\x00\x00\x00\x00\x00\x00"},
+        buffer_key="",
+    )
+    return typetracer_array(meta)
+
+
 def from_parquet(
     path,
     storage_options=None,
@@ -78,6 +103,8 @@ def from_parquet(
         a partition. If None, the existence of a `_metadata` file and
         ignore_metadata=False implies True, else False.
     """
+    from fsspec.core import get_fs_token_paths
+
     fs, tok, paths = get_fs_token_paths(
         path, mode="rb", storage_options=storage_options
     )
@@ -99,12 +126,7 @@ def from_parquet(
     if split_row_groups is None:
         split_row_groups = row_counts is not None and len(row_counts) > 1
 
-    meta = from_buffers(
-        subform,
-        length=0,
-        container={"": b"\x00\x00\x00\x00\x00\x00\x00\x00"},
-        buffer_key="",
-    )
+    meta = _typetracer_for_subform(subform.to_json())
 
     if split_row_groups is False or subrg is None:
         # file-wise
@@ -117,40 +139,70 @@ def from_parquet(
             actual_paths,
             label=label,
             token=token,
-            meta=typetracer_array(meta),
+            meta=meta,
         )
     else:
         # row-group wise
+        rg_objs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
 
         if set(subrg) == {None}:
             rgs_paths = {path: 0 for path in actual_paths}
-            for i in range(metadata.num_row_groups):
-                fp = metadata.row_group(i).column(0).file_path
-                rgs_path = [p for p in rgs_paths if fp in p][
-                    0
-                ]  # returns 1st if fp is empty
+            # map full paths, paths relative to the dataset root(s) (as
+            # written to _metadata, e.g. for hive-partitioned layouts) and
+            # basenames to the canonical path so that most file_path
+            # entries resolve with one lookup
+            roots = [r.rstrip("/") + "/" for r in paths if r not in rgs_paths]
+            path_index = {}
+            for p in actual_paths:
+                path_index.setdefault(p, p)
+                for root in roots:
+                    if p.startswith(root):
+                        path_index.setdefault(p[len(root) :], p)
+                path_index.setdefault(p.rsplit("/", 1)[-1], p)
+            file_paths = [rg.column(0).file_path for rg in rg_objs]
+            for fp in file_paths:
+                if not fp:
+                    # empty file_path refers to the first file
+                    rgs_path = actual_paths[0]
+                elif fp in path_index:
+                    rgs_path = path_index[fp]
+                else:
+                    match = next((k for k in path_index if fp in k), None)
+                    if match is None:
+                        raise ValueError(
+                            f"Row group file_path {fp!r} does not match any "
+                            "data file in the dataset"
+                        )
+                    rgs_path = path_index[match]
+                    path_index[fp] = rgs_path
                 rgs_paths[rgs_path] += 1
 
-            subrg = [list(range(i)) for _ in actual_paths]
+            subrg = [list(range(rgs_paths[p])) for p in actual_paths]
 
-        rgs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
-        divisions = [0] + list(
-            itertools.accumulate([rg.num_rows for rg in rgs], operator.add)
+        nrows = np.fromiter(
+            (rg.num_rows for rg in rg_objs),
+            dtype=np.int64,
+            count=len(rg_objs),
         )
-        pairs = []
-        for rgs, path in zip(subrg, actual_paths):
-            pairs.extend([(rg, path) for rg in rgs])
+        divisions = np.empty(nrows.size + 1, dtype=np.int64)
+        divisions[0] = 0
+        np.cumsum(nrows, out=divisions[1:])
+        # each path is stored once on the partition function and the
+        # inputs refer to it by index
+        paths = list(actual_paths)
+        pairs = [(rg, pi) for pi, rgs in enumerate(subrg) for rg in rgs]
         return from_map(
             _FromParquetFragmentWiseFn(
                 fs,
                 columns,
                 subform,
+                paths,
             ),
             pairs,
             label=label,
             token=token,
-            divisions=tuple(divisions),
-            meta=typetracer_array(meta),
+            divisions=tuple(divisions.tolist()),
+            meta=meta,
         )
 
 
@@ -161,9 +213,9 @@ def _file_to_partition(path, fs, columns, schema, subrg=None):
         fs=fs,
         parquet_columns=columns,
         subrg=subrg or [None],
-        footer_sample_size=2**15,
-        max_gap=2**10,
-        max_block=2**22,
+        footer_sample_size=_FOOTER_SAMPLE_SIZE,
+        max_gap=_MAX_GAP,
+        max_block=_MAX_BLOCK,
         generate_bitmasks=False,
         metadata=None,
         highlevel=True,
@@ -174,7 +226,7 @@ def _file_to_partition(path, fs, columns, schema, subrg=None):
 
 def _metadata_file_from_data_files(path_list, fs, out_path):
     """
-    Aggregate _metadata and _common_metadata from data files
+    Aggregate _metadata from data files
 
     Maybe only used in testing
 
@@ -186,17 +238,27 @@ def _metadata_file_from_data_files(path_list, fs, out_path):
     out_path: str
         Root directory of the dataset
     """
+    import pyarrow.parquet as pq
+
     meta = None
     out_path = out_path.rstrip("/")
     for path in path_list:
         assert path.startswith(out_path)
+
+    def _read_one(path):
         with fs.open(path, "rb") as f:
             _meta = pq.ParquetFile(f).metadata
         _meta.set_file_path(path[len(out_path) + 1 :])
-        if meta:
-            meta.append_row_groups(_meta)
-        else:
-            meta = _meta
+        return _meta
+
+    # footer reads are I/O bound, so fetch them concurrently; map
+    # yields in submission order so the output is deterministic
+    with ThreadPoolExecutor(max_workers=min(32, len(path_list))) as executor:
+        for _meta in executor.map(_read_one, path_list):
+            if meta:
+                meta.append_row_groups(_meta)
+            else:
+                meta = _meta
     _write_metadata(fs, out_path, meta)
 
 
@@ -208,19 +270,31 @@ def _metadata_file_from_metas(fs, out_path, *metas):
     _write_metadata(fs, out_path, meta)
 
 
+def _concat_parts(*parts):
+    """Concatenate lists of partition write results"""
+    return list(itertools.chain.from_iterable(parts))
+
+
+def _metadata_file_from_parts(fs, out_path, *parts):
+    """Write metadata from gathered partition write results"""
+    metas = [d["meta"] for d in itertools.chain.from_iterable(parts)]
+    _metadata_file_from_metas(fs, out_path, *metas)
+
+
+def _finalize_parts(*parts):
+    return None
+
+
 def _write_metadata(fs, out_path, meta):
     """Output metadata files"""
     metadata_path = "/".join([out_path, "_metadata"])
     with fs.open(metadata_path, "wb") as fil:
         meta.write_metadata_file(fil)
-    metadata_path = "/".join([out_path, "_metadata"])
-    with fs.open(metadata_path, "wb") as fil:
-        meta.write_metadata_file(fil)
 
 
 def _write_partition(
     data,
-    path,  # dataset root
+    prefix,  # dataset root, including the trailing separator
     fs,
     filename,  # relative path within the dataset
     # partition_on=Fa,  # must be top-level leaf (i.e., a simple column)
@@ -229,6 +303,8 @@ def _write_partition(
     head=False,  # is this the first piece
     # custom_metadata=None,
 ):
+    import pyarrow.parquet as pq
+
     t = to_arrow_table(
         data,
         list_to32=True,
@@ -238,7 +314,7 @@ def _write_partition(
         extensionarray=False,
     )
     md_list = []
-    with fs.open(fs.sep.join([path, filename]), "wb") as fil:
+    with fs.open(prefix + filename, "wb") as fil:
         pq.write_table(
             t,
             fil,
@@ -277,12 +353,14 @@ class _ToParquetFn:
         self.zfill = (
             math.ceil(math.log(npartitions, 10)) if npartitions is not None else 1
         )
+        self._fmt = f"part{{:0{self.zfill}d}}.parquet"
+        self._prefix = fs.sep.join([path, ""])
 
     def __call__(self, data, block_index):
-        filename = f"part{str(block_index[0]).zfill(self.zfill)}.parquet"
+        filename = self._fmt.format(block_index[0])
         return _write_partition(
             data,
-            self.path,
+            self._prefix,
             self.fs,
             filename,
             return_metadata=self.return_metadata,
@@ -302,7 +380,7 @@ def to_parquet(data, path, storage_options=None, write_metadata=False, compute=T
     storage_options: dict
         arguments to pass to fsspec for creating the filesystem
     write_metadata: bool
-        Whether to create _metadata and _common_metadata files
+        Whether to create a _metadata file
     compute: bool
         Whether to immediately start writing or to return the dask
         collection which can be computed at the user's discression.
@@ -311,6 +389,8 @@ def to_parquet(data, path, storage_options=None, write_metadata=False, compute=T
     -------
     If compute=False, a dask Scalar representing the process
     """
+    import fsspec
+
     # TODO options we need:
     #  - compression per data type or per leaf column ("path.to.leaf": "zstd" format)
     #  - byte stream split for floats if compression is not None or lzma
@@ -322,22 +402,43 @@ def to_parquet(data, path, storage_options=None, write_metadata=False, compute=T
     name = f"write-parquet-{tokenize(fs, data, path)}"
 
     map_res = map_partitions(
-        _ToParquetFn(fs, path=path, npartitions=data.npartitions),
+        _ToParquetFn(
+            fs,
+            path=path,
+            return_metadata=write_metadata,
+            npartitions=data.npartitions,
+        ),
         data,
         BlockIndex((data.npartitions,)),
         label="to-parquet",
         meta=data._meta,
     )
 
+    # gather the per-partition results with a tree reduction so that
+    # no single task depends on every partition
+    splitev = 8
+    b_name = map_res.name
+    k = data.npartitions
+    agg_name = name + "-aggregate"
+    depth = 0
     dsk = {}
+    while k > splitev:
+        c_name = f"{agg_name}{depth}"
+        i = 0
+        for indices in partition_all(splitev, range(k)):
+            dsk[(c_name, i)] = (_concat_parts,) + tuple((b_name, j) for j in indices)
+            i += 1
+        k = i
+        b_name = c_name
+        depth += 1
+
+    parts = tuple((b_name, j) for j in range(k))
     if write_metadata:
         final_name = name + "-metadata"
-        dsk[(final_name, 0)] = (_metadata_file_from_metas, fs, path) + tuple(
-            map_res.__dask_keys__()
-        )
+        dsk[(final_name, 0)] = (_metadata_file_from_parts, fs, path) + parts
     else:
         final_name = name + "-finalize"
-        dsk[(final_name, 0)] = (lambda *_: None, map_res.__dask_keys__())
+        dsk[(final_name, 0)] = (_finalize_parts,) + parts
     graph = HighLevelGraph.from_collections(final_name, dsk, dependencies=[map_res])
     out = new_scalar_object(graph, final_name, meta=None)
     if compute:
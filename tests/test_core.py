@@ -82,7 +82,7 @@ def test_form(ndjson_points_file: str) -> None:
     assert daa.form == EmptyForm()
 
 
-@pytest.mark.parametrize("nparts", [2, 3, 4])
+@pytest.mark.parametrize("nparts", [1, 2, 3, 4])
 def test_from_awkward(caa: ak.Array, nparts: int) -> None:
     daa = dak.from_awkward(caa, npartitions=nparts)
     assert_eq(caa, daa, check_forms=False)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import awkward._v2 as ak
+import dask
 import pytest
 from dask.array.utils import assert_eq as da_assert_eq
 from dask.delayed import delayed
@@ -140,6 +141,15 @@ def test_delayed_single_node():
     assert_eq(c, a)
 
 
+def test_from_delayed_blockwise_layer() -> None:
+    from dask.blockwise import Blockwise
+
+    a = ak.Array([[1, 2, 3], [4]])
+    c = dak.from_delayed([delayed(a), delayed(a)])
+    assert isinstance(c.dask.layers[c.name], Blockwise)
+    assert_eq(dak.num(c, axis=1), ak.num(ak.concatenate([a, a]), axis=1))
+
+
 def test_from_map_with_args_kwargs() -> None:
     import dask.core
 
@@ -204,6 +214,29 @@ def test_from_map_enumerate() -> None:
     assert_eq(a1, a2)
 
 
+def test_from_awkward_graph_pickles() -> None:
+    import pickle
+
+    a = ak.Array([[1, 2, 3], [4], [5, 6]])
+    c = dak.from_awkward(a, npartitions=2)
+    assert_eq(c, a)
+    dsk = pickle.loads(pickle.dumps(c.dask))
+    c2 = dak.lib.core.new_array_object(dsk, c.name, meta=c._meta, divisions=c.divisions)
+    assert_eq(c2, a)
+    d = pickle.loads(pickle.dumps(c.to_delayed()[0]))
+    assert d.compute().tolist() == [[1, 2, 3], [4]]
+
+
+def test_from_map_copies_inputs() -> None:
+    def f(a):
+        return ak.Array([a])
+
+    src = [1, 2, 3]
+    c = dak.from_map(f, src)
+    src[0] = 100
+    assert c.compute().tolist() == [1, 2, 3]
+
+
 def test_from_map_exceptions() -> None:
     def f(a, b):
         return ak.Array([a, b])
@@ -239,6 +272,7 @@ def test_from_lists(caa_p1: ak.Array) -> None:
     daa = dak.from_lists([one, two])
     caa = ak.Array(one + two)
     assert_eq(daa, caa)
+    assert daa.name == dak.from_lists([one, two]).name
 
 
 def test_to_dask_array(daa: dak.Array, caa: dak.Array) -> None:
@@ -268,6 +302,32 @@ def test_to_delayed(daa, caa, optimize_graph):
     assert caa.points.tolist() == comped.tolist()
 
 
+def test_to_delayed_optimized_graph_cached(daa):
+    points = daa.points
+    d1 = points.to_delayed(optimize_graph=True)
+    d2 = points.to_delayed(optimize_graph=True)
+    assert d1[0].dask is d2[0].dask
+
+
+def test_to_delayed_optimized_graph_cache_respects_config(daa):
+    from dask_awkward.lib.optimize import basic_optimize
+
+    calls = []
+
+    def myopt(dsk, keys, **kwargs):
+        calls.append(keys)
+        return basic_optimize(dsk, keys, **kwargs)
+
+    points = daa.points
+    d1 = points.to_delayed(optimize_graph=True)
+    with dask.config.set(awkward_array_optimize=myopt):
+        d2 = points.to_delayed(optimize_graph=True)
+        points.to_delayed(optimize_graph=True)
+    assert len(calls) == 1
+    assert d1[0].dask is not d2[0].dask
+    assert d1[0].dask is points.to_delayed(optimize_graph=True)[0].dask
+
+
 def test_to_bag(daa, caa):
     a = daa.to_dask_bag()
     for comprec, entry in zip(a.compute(), caa):
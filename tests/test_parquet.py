@@ -151,3 +151,57 @@ def test_write_roundtrip(tmpdir):
     arr = dak.from_awkward(ak.from_iter(data), 2)
     to_parquet(arr, tmpdir)
     arr = dak.from_parquet(tmpdir)
+
+
+def test_dir_of_uneven_row_groups_metadata(tmpdir):
+    import pyarrow.parquet as pq
+
+    tmpdir = str(tmpdir)
+    paths = ["/".join([tmpdir, _]) for _ in ["part-0.parquet", "part-1.parquet"]]
+    pq.write_table(ds, paths[0])
+    pq.write_table(ds, paths[1], row_group_size=1)
+    _metadata_file_from_data_files(paths, fs, tmpdir)
+
+    arr = dak.from_parquet(tmpdir, ignore_metadata=False, split_row_groups=True)
+    assert arr.npartitions == 4
+    assert arr["arr"].compute().to_list() == data * 2
+
+
+@pytest.mark.parametrize("npartitions", [2, 20])
+def test_write_metadata(tmpdir, npartitions):
+    import pyarrow.parquet as pq
+
+    tmpdir = str(tmpdir)
+    arr = dak.from_awkward(ak.Array(list(range(40))), npartitions)
+    to_parquet(arr, tmpdir, write_metadata=True)
+    md = pq.read_metadata("/".join([tmpdir, "_metadata"]))
+    assert md.num_row_groups == npartitions
+    assert md.num_rows == 40
+
+
+def test_hive_dir_of_uneven_row_groups_metadata(tmpdir):
+    import pyarrow.parquet as pq
+
+    tmpdir = str(tmpdir)
+    paths = ["/".join([tmpdir, _, "part-0.parquet"]) for _ in ["k=1", "k=2"]]
+    for p in paths:
+        fs.mkdir(p.rsplit("/", 1)[0])
+    pq.write_table(ds, paths[0])
+    pq.write_table(ds, paths[1], row_group_size=1)
+    _metadata_file_from_data_files(paths, fs, tmpdir)
+
+    arr = dak.from_parquet(tmpdir, ignore_metadata=False, split_row_groups=True)
+    assert arr.npartitions == 4
+    assert arr["arr"].compute().to_list() == data * 2
+
+
+def test_metadata_file_path_mismatch(tmpdir):
+    tmpdir = str(tmpdir)
+    paths = ["/".join([tmpdir, _]) for _ in ["part-0.parquet", "part-1.parquet"]]
+    pad.write_dataset(ds, tmpdir, format="parquet")
+    fs.cp(paths[0], paths[1])
+    _metadata_file_from_data_files(paths, fs, tmpdir)
+    fs.mv(paths[1], "/".join([tmpdir, "part-2.parquet"]))
+
+    with pytest.raises(ValueError, match="part-1.parquet"):
+        dak.from_parquet(tmpdir, ignore_metadata=False, split_row_groups=True)